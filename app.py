@@ -1,6 +1,14 @@
 import os
+import atexit
+import copy
+import hashlib
 import json
-from datetime import datetime
+import queue
+import re
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from datetime import date, datetime
 from flask import (
     Flask,
     render_template,
@@ -13,16 +21,40 @@ from flask import (
     abort,
     jsonify,
     session,
+    g,
+    Request,
+    Response,
+    make_response,
+)
+from urllib.parse import quote
+from werkzeug.security import (
+    check_password_hash,
+    generate_password_hash,
+    safe_join,
 )
-from werkzeug.utils import secure_filename
 from dotenv import load_dotenv
 from typing import List, Iterable
+import secrets
 import smtplib
+import sqlite3
+import tempfile
+import threading
 import time
+import uuid
+from email import policy as email_policy
 from email.message import EmailMessage
-from io import BytesIO
 from openpyxl import Workbook
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder/decoder
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process file locking
+    fcntl = None
+
 # Load environment variables from .env file for local development
 load_dotenv()
 
@@ -30,6 +62,9 @@ load_dotenv()
 app = Flask(__name__)
 app.secret_key = os.environ.get("SECRET_KEY", "dev-secret-key")
 
+# Optional token granting admin access without a session (read once)
+_ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN') or ''
+
 
 # Canonical list of positions used across the app
 POSITIONS: List[str] = [
@@ -47,6 +82,9 @@ POSITIONS: List[str] = [
 DATA_DIR = os.environ.get('RENDER_DISK_PATH', '.')
 
 # 1. Define paths for your data files using the DATA_DIR
+# Registrations and contact queries live in SQLite. The older JSON
+# files are only read once, to migrate existing data into the database.
+DATABASE_FILE = os.path.join(DATA_DIR, 'app.db')
 REGISTRATIONS_FILE = os.path.join(DATA_DIR, 'registrations.json')
 QUERIES_FILE = os.path.join(DATA_DIR, 'queries.json')
 UPDATES_FILE = os.path.join(DATA_DIR, 'updates.json')
@@ -61,9 +99,25 @@ os.makedirs(
 # 3. Configure Flask to use the upload folder and set limits
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50 MB max upload
-ALLOWED_EXTENSIONS = {
+ALLOWED_EXTENSIONS = frozenset({
     'png', 'jpg', 'jpeg', 'gif', 'webp', 'pdf', 'docx', 'zip'
-}
+})
+
+# 4. Optionally let the front web server send uploaded files from disk.
+#    USE_X_SENDFILE=true emits X-Sendfile (Apache/lighttpd);
+#    UPLOADS_ACCEL_REDIRECT=/_protected_uploads/ emits X-Accel-Redirect
+#    for an nginx 'internal' location aliased to UPLOAD_FOLDER.
+app.config['USE_X_SENDFILE'] = os.environ.get(
+    'USE_X_SENDFILE', 'false'
+).lower() in ('1', 'true', 'yes', 'on')
+UPLOADS_ACCEL_REDIRECT = os.environ.get('UPLOADS_ACCEL_REDIRECT', '')
+
+# 5. Generated Excel exports are kept on disk so repeat downloads are
+#    plain file sends (X-Sendfile above, or EXPORTS_ACCEL_REDIRECT for
+#    an nginx 'internal' location aliased to EXPORTS_FOLDER).
+EXPORTS_FOLDER = os.path.join(DATA_DIR, 'exports')
+os.makedirs(EXPORTS_FOLDER, exist_ok=True)
+EXPORTS_ACCEL_REDIRECT = os.environ.get('EXPORTS_ACCEL_REDIRECT', '')
 # --- END OF STORAGE CONFIGURATION ---
 
 # Mail templates storage file (after DATA_DIR is defined)
@@ -74,11 +128,98 @@ ADMIN_CREDENTIALS_FILE = os.path.join(DATA_DIR, 'admin_credentials.json')
 SITE_CONTENT_FILE = os.path.join(DATA_DIR, 'site_content.json')
 
 
+# '.png', '.jpg', ... for a single C-level str.endswith() per check
+_ALLOWED_SUFFIXES = tuple('.' + ext for ext in sorted(ALLOWED_EXTENSIONS))
+
+
 def allowed_file(filename):
-    return (
-        '.' in filename
-        and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
-    )
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
+
+
+# Threads used to write the files of one registration in parallel
+UPLOAD_SAVE_WORKERS = 8
+# Prefix of the temp files that uploads are parsed into (in UPLOAD_FOLDER)
+UPLOAD_TEMP_PREFIX = '.upload-'
+
+
+class UploadRequest(Request):
+    """Request that parses allowed file uploads straight into temp files
+    inside UPLOAD_FOLDER, so save_file() only has to rename them instead
+    of copying the bytes a second time. Unclaimed temp files are removed
+    when the request is closed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._upload_temps: list[str] = []
+
+    def _get_file_stream(self, total_content_length, content_type,
+                         filename=None, content_length=None):
+        if filename and allowed_file(filename):
+            tmp = tempfile.NamedTemporaryFile(
+                dir=app.config['UPLOAD_FOLDER'],
+                prefix=UPLOAD_TEMP_PREFIX,
+                delete=False,
+            )
+            self._upload_temps.append(tmp.name)
+            return tmp
+        return super()._get_file_stream(
+            total_content_length, content_type, filename, content_length
+        )
+
+    def close(self):
+        super().close()
+        for path in self._upload_temps:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+
+app.request_class = UploadRequest
+
+
+def _parsed_upload_path(stream):
+    """Return the temp path an UploadRequest parsed this stream into."""
+    name = getattr(stream, 'name', None)
+    # NamedTemporaryFile names are absolute even for a relative dir
+    # (UPLOAD_FOLDER is './uploads' with the default DATA_DIR)
+    if (
+        isinstance(name, str)
+        and os.path.basename(name).startswith(UPLOAD_TEMP_PREFIX)
+        and os.path.dirname(name)
+        == os.path.abspath(app.config['UPLOAD_FOLDER'])
+    ):
+        return name
+    return None
+
+
+# Leading bytes ("magic numbers") expected for each allowed extension
+_FILE_SIGNATURES = {
+    'png': (b'\x89PNG\r\n\x1a\n',),
+    'jpg': (b'\xff\xd8\xff',),
+    'jpeg': (b'\xff\xd8\xff',),
+    'gif': (b'GIF87a', b'GIF89a'),
+    'webp': (b'RIFF',),
+    'pdf': (b'%PDF-',),
+    'docx': (b'PK\x03\x04',),
+    'zip': (b'PK\x03\x04', b'PK\x05\x06'),
+}
+
+
+def _content_matches_extension(stream, ext: str) -> bool:
+    """Sniff the first bytes of an upload and check they match ext.
+    The stream position is restored afterwards.
+    """
+    pos = stream.tell()
+    head = stream.read(1024)
+    stream.seek(pos)
+    if ext == 'pdf':
+        # The PDF header may follow a few bytes of junk
+        return b'%PDF-' in head
+    if ext == 'webp' and head[8:12] != b'WEBP':
+        return False
+    return head.startswith(_FILE_SIGNATURES.get(ext, ()))
 
 
 def save_file(file):
@@ -86,36 +227,521 @@ def save_file(file):
         return None
     if not allowed_file(file.filename):
         return None
-    filename = secure_filename(file.filename)
-    base, ext = os.path.splitext(filename)
+    # allowed_file() guarantees a known '.ext' suffix
+    ext = file.filename[file.filename.rfind('.'):].lower()
+    # Reject files whose content doesn't match their extension before
+    # they are stored
+    if not _content_matches_extension(file.stream, ext[1:]):
+        return None
+    # Store under a random name so uploads never collide; the extension
+    # has already been validated above.
+    filename = f"{uuid.uuid4().hex}{ext}"
     dest = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-    if os.path.exists(dest):
-        suffix = datetime.now().strftime('%Y%m%d%H%M%S%f')
-        filename = f"{base}_{suffix}{ext}"
-        dest = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-    file.save(dest)
+    # UploadRequest has parsed every allowed file into a temp file next
+    # to its final home, so storing it needs no copy
+    src = _parsed_upload_path(file.stream)
+    if src is None:
+        return None
+    # link() is an atomic no-clobber rename; fall back to rename() where
+    # the filesystem has no hard links.
+    file.stream.flush()
+    os.fchmod(file.stream.fileno(), 0o644)
+    try:
+        os.link(src, dest)
+    except FileExistsError:
+        raise
+    except OSError:
+        os.rename(src, dest)
+    else:
+        os.unlink(src)
     return filename
 
 
+def save_files(files):
+    """Save several uploads concurrently with save_file().
+    Returns the stored filenames (or None) in the same order as files.
+    """
+    files = list(files)
+    if len(files) < 2:
+        return [save_file(f) for f in files]
+    workers = min(UPLOAD_SAVE_WORKERS, len(files))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(save_file, files))
+
+
+def discard_files(filenames):
+    """Remove stored uploads (None entries are skipped)."""
+    for name in filenames:
+        if not name:
+            continue
+        try:
+            os.unlink(os.path.join(app.config['UPLOAD_FOLDER'], name))
+        except FileNotFoundError:
+            pass
+
+
+def _json_loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_pretty(obj) -> bytes:
+    """Indented UTF-8 JSON for the hand-editable settings files."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+# Parsed JSON settings files: path -> (mtime_ns, size, parsed object).
+# Repeated loads cost one os.stat() until the file changes on disk.
+_JSON_CACHE: dict[str, tuple[int, int, object]] = {}
+
+
+def _cached_read_json(path):
+    """Parse the JSON file at path, reusing the previous parse while the
+    file's mtime and size are unchanged. The result is shared between
+    callers: copy it before mutating. Raises OSError/ValueError like a
+    plain read would.
+    """
+    st = os.stat(path)
+    cached = _JSON_CACHE.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    with open(path, 'rb') as f:
+        data = _json_loads(f.read())
+    _JSON_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def _remember_json(path, data):
+    """Record data as the parsed content of path right after writing it,
+    so the next _cached_read_json() doesn't go back to disk.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        _JSON_CACHE.pop(path, None)
+        return
+    _JSON_CACHE[path] = (st.st_mtime_ns, st.st_size, copy.deepcopy(data))
+
+
+@contextmanager
+def _file_lock(path):
+    """Hold an exclusive lock on path + '.lock' for the duration.
+    Serializes writers across gunicorn worker processes sharing DATA_DIR.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(path + '.lock', 'w') as lk:
+        fcntl.flock(lk, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lk, fcntl.LOCK_UN)
+
+
+def _write_json(path, data, locked=False):
+    """Replace the JSON file at path with data: serialized in memory,
+    written with a single write() to a temp file in the same directory,
+    then renamed over the original so readers never see a torn file.
+    Pass locked=True when the caller already holds _file_lock(path)
+    around its read-modify-write (flock isn't reentrant).
+    """
+    payload = _json_pretty(data)
+    with nullcontext() if locked else _file_lock(path):
+        fd, tmp = tempfile.mkstemp(
+            prefix='.tmp-', dir=os.path.dirname(path) or '.'
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    _remember_json(path, data)
+
+
 def _load_list(path):
+    """Read a legacy JSON array file (used for migration)."""
     if not os.path.exists(path):
         return []
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            # Backfill missing review_status as 'pending'
-            if isinstance(data, list):
-                for r in data:
-                    if isinstance(r, dict) and 'review_status' not in r:
-                        r['review_status'] = 'pending'
-            return data
+        with open(path, 'rb') as f:
+            data = _json_loads(f.read())
     except Exception:
         return []
+    return data if isinstance(data, list) else []
+
+
+# --- SQLITE STORAGE (registrations, queries) ---
+
+_DB_LOCAL = threading.local()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS registrations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    review_status TEXT NOT NULL DEFAULT 'pending',
+    selected_position TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_registrations_status
+    ON registrations(review_status);
+CREATE INDEX IF NOT EXISTS idx_registrations_status_position
+    ON registrations(review_status, selected_position);
+CREATE TABLE IF NOT EXISTS queries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('registrations_version', 0);
+CREATE TABLE IF NOT EXISTS mail_jobs (
+    id TEXT PRIMARY KEY,
+    subject TEXT NOT NULL,
+    recipients INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    sent INTEGER,
+    error TEXT,
+    queued TEXT NOT NULL,
+    finished TEXT
+);
+CREATE TRIGGER IF NOT EXISTS registrations_version_insert
+    AFTER INSERT ON registrations BEGIN
+    UPDATE meta SET value = value + 1 WHERE key = 'registrations_version';
+END;
+CREATE TRIGGER IF NOT EXISTS registrations_version_update
+    AFTER UPDATE ON registrations BEGIN
+    UPDATE meta SET value = value + 1 WHERE key = 'registrations_version';
+END;
+CREATE TRIGGER IF NOT EXISTS registrations_version_delete
+    AFTER DELETE ON registrations BEGIN
+    UPDATE meta SET value = value + 1 WHERE key = 'registrations_version';
+END;
+"""
+
+# Registration keys stored in their own columns rather than the data blob
+_REG_COLUMN_KEYS = ('id', 'review_status', 'selected_position')
+
+# Up to this much of the database is memory-mapped, so reads come
+# straight from the page cache instead of being copied out by read()
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+
+
+def _db() -> sqlite3.Connection:
+    """Return this thread's SQLite connection.
+    Connections run in autocommit mode with WAL journaling, so readers
+    never block the writer; multi-statement writes use BEGIN IMMEDIATE.
+    """
+    conn = getattr(_DB_LOCAL, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(
+            DATABASE_FILE, timeout=30, isolation_level=None
+        )
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        # Sorts/temp b-trees (ORDER BY, IN lists) stay off the disk
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute(f'PRAGMA mmap_size={SQLITE_MMAP_SIZE}')
+        _DB_LOCAL.conn = conn
+    return conn
+
+
+def _json_text(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _row_to_registration(row) -> dict:
+    reg_id, review_status, selected_position, data = row
+    r = _json_loads(data)
+    r['id'] = reg_id
+    r['review_status'] = review_status
+    if selected_position is not None:
+        r['selected_position'] = selected_position
+    return r
+
+
+def _registration_values(reg: dict):
+    data = {k: v for k, v in reg.items() if k not in _REG_COLUMN_KEYS}
+    return (
+        reg.get('review_status') or 'pending',
+        reg.get('selected_position'),
+        _json_text(data),
+    )
+
+
+def _registrations_where(status: str | None,
+                         position: str | None) -> tuple[str, list]:
+    where, args = [], []
+    if status:
+        where.append('review_status = ?')
+        args.append(status)
+    if position:
+        where.append('selected_position = ?')
+        args.append(position)
+    if not where:
+        return '', args
+    return ' WHERE ' + ' AND '.join(where), args
+
+
+def _list_registrations(status: str | None = None,
+                        position: str | None = None) -> list[dict]:
+    """Return registrations newest first, optionally filtered by
+    review_status and selected_position.
+    """
+    where, args = _registrations_where(status, position)
+    sql = (
+        'SELECT id, review_status, selected_position, data '
+        'FROM registrations' + where + ' ORDER BY id DESC'
+    )
+    return [_row_to_registration(row) for row in _db().execute(sql, args)]
+
+
+def _registration_field_rows(fields: tuple[str, ...],
+                             status: str | None = None,
+                             position: str | None = None):
+    """Yield [value, ...] for the given fields of each registration,
+    newest first, with '' for missing values. SQLite pulls the fields
+    out of the JSON itself, so no registration document gets decoded.
+    """
+    cols = ', '.join(
+        f if f in _REG_COLUMN_KEYS else f"json_extract(data, '$.{f}')"
+        for f in fields
+    )
+    where, args = _registrations_where(status, position)
+    sql = f'SELECT {cols} FROM registrations{where} ORDER BY id DESC'
+    for row in _db().execute(sql, args):
+        yield [v or '' for v in row]
+
+
+def _get_registration(reg_id: int) -> dict | None:
+    row = _db().execute(
+        'SELECT id, review_status, selected_position, data '
+        'FROM registrations WHERE id = ?',
+        (reg_id,),
+    ).fetchone()
+    return _row_to_registration(row) if row else None
+
+
+def _insert_registration(reg: dict) -> int:
+    cur = _db().execute(
+        'INSERT INTO registrations (review_status, selected_position, data) '
+        'VALUES (?, ?, ?)',
+        _registration_values(reg),
+    )
+    return cur.lastrowid
+
+
+def _update_registration(reg_id: int, **fields) -> bool:
+    """Update review_status/selected_position columns for one row."""
+    cols = [k for k in fields if k in _REG_COLUMN_KEYS and k != 'id']
+    if not cols:
+        return False
+    cur = _db().execute(
+        'UPDATE registrations SET '
+        + ', '.join(f'{c} = ?' for c in cols)
+        + ' WHERE id = ?',
+        [fields[c] for c in cols] + [reg_id],
+    )
+    return cur.rowcount > 0
+
+
+def _delete_registrations(ids: Iterable[int] | None = None,
+                          status: str | None = None) -> int:
+    """Delete registrations by id and/or review_status.
+    Returns the number of rows removed.
+    """
+    where, args = [], []
+    if ids is not None:
+        ids = list(ids)
+        if not ids:
+            return 0
+        where.append(f"id IN ({', '.join('?' * len(ids))})")
+        args.extend(ids)
+    if status:
+        where.append('review_status = ?')
+        args.append(status)
+    if not where:
+        return 0
+    cur = _db().execute(
+        'DELETE FROM registrations WHERE ' + ' AND '.join(where), args
+    )
+    return cur.rowcount
+
+
+def _registrations_version() -> int:
+    """Counter bumped by triggers on every registrations write, from any
+    process; cheap to read and safe to key caches on.
+    """
+    row = _db().execute(
+        "SELECT value FROM meta WHERE key = 'registrations_version'"
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def _list_queries() -> list[dict]:
+    """Return contact queries oldest first."""
+    return [
+        _json_loads(data)
+        for (data,) in _db().execute('SELECT data FROM queries ORDER BY id')
+    ]
+
+
+def _insert_query(query: dict):
+    _db().execute('INSERT INTO queries (data) VALUES (?)',
+                  (_json_text(query),))
+
+
+# Registrations are written by a single background thread so the
+# register POST can answer as soon as its uploads are on disk. The
+# thread group-commits: whatever arrives within REGISTRATION_BATCH_WAIT
+# of the first queued item (up to REGISTRATION_BATCH_MAX) shares one
+# transaction, i.e. one WAL commit.
+REGISTRATION_BATCH_MAX = 64
+REGISTRATION_BATCH_WAIT = 0.010
+_REGISTRATION_QUEUE: queue.Queue = queue.Queue()
+_REGISTRATION_WRITER: threading.Thread | None = None
+_REGISTRATION_WRITER_LOCK = threading.Lock()
+
+
+def _store_registration(reg: dict):
+    try:
+        _insert_registration(reg)
+    except Exception:
+        app.logger.exception('Failed to store registration: %r', reg)
 
 
-def _save_list(path, data_list):
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data_list, f, ensure_ascii=False, indent=2)
+def _store_registrations(batch: list[dict]):
+    """Insert a batch in one transaction; on failure retry one by one so
+    a single bad row can't take the rest of the batch down with it.
+    """
+    if len(batch) == 1:
+        _store_registration(batch[0])
+        return
+    conn = _db()
+    try:
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            for reg in batch:
+                _insert_registration(reg)
+            conn.execute('COMMIT')
+            return
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+    except Exception:
+        app.logger.exception('Batch insert failed; storing individually')
+    for reg in batch:
+        _store_registration(reg)
+
+
+def _registration_writer_loop():
+    while True:
+        batch = [_REGISTRATION_QUEUE.get()]
+        deadline = time.monotonic() + REGISTRATION_BATCH_WAIT
+        while len(batch) < REGISTRATION_BATCH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_REGISTRATION_QUEUE.get(timeout=remaining))
+            except queue.Empty:
+                break
+        try:
+            _store_registrations(batch)
+        finally:
+            for _ in batch:
+                _REGISTRATION_QUEUE.task_done()
+
+
+def _enqueue_registration(reg: dict):
+    """Queue a registration for insertion by the writer thread."""
+    global _REGISTRATION_WRITER
+    with _REGISTRATION_WRITER_LOCK:
+        # Started lazily so each (forked) worker process gets its own
+        if _REGISTRATION_WRITER is None or not _REGISTRATION_WRITER.is_alive():
+            _REGISTRATION_WRITER = threading.Thread(
+                target=_registration_writer_loop,
+                name='registration-writer',
+                daemon=True,
+            )
+            _REGISTRATION_WRITER.start()
+    _REGISTRATION_QUEUE.put(reg)
+
+
+@atexit.register
+def _flush_registration_queue():
+    """Store anything still queued when the process shuts down."""
+    if _REGISTRATION_WRITER is not None and _REGISTRATION_WRITER.is_alive():
+        # The writer may hold a dequeued batch in its wait window or
+        # mid-commit; let it finish everything rather than racing it
+        _REGISTRATION_QUEUE.join()
+        return
+    batch = []
+    while True:
+        try:
+            batch.append(_REGISTRATION_QUEUE.get_nowait())
+        except queue.Empty:
+            break
+    if batch:
+        _store_registrations(batch)
+        for _ in batch:
+            _REGISTRATION_QUEUE.task_done()
+
+
+def _init_db():
+    """Create the schema and import legacy JSON data on first run."""
+    conn = _db()
+    conn.executescript(_SCHEMA)
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        # The JSON files stay on disk, so the import is recorded in meta;
+        # an emptied table must not bring old rows back on restart.
+        # Databases that already hold rows were imported before the
+        # marker existed and are only marked.
+        imported = conn.execute(
+            "SELECT 1 FROM meta WHERE key = 'legacy_imported'"
+        ).fetchone()
+        has_regs = conn.execute(
+            'SELECT 1 FROM registrations LIMIT 1'
+        ).fetchone()
+        if not imported and not has_regs:
+            regs = _load_list(REGISTRATIONS_FILE)
+            # Keep the original ids; insert oldest first
+            for r in sorted(regs, key=lambda r: r.get('id') or 0):
+                conn.execute(
+                    'INSERT INTO registrations '
+                    '(id, review_status, selected_position, data) '
+                    'VALUES (?, ?, ?, ?)',
+                    (r.get('id'),) + _registration_values(r),
+                )
+        has_queries = conn.execute('SELECT 1 FROM queries LIMIT 1').fetchone()
+        if not imported and not has_queries:
+            for q in _load_list(QUERIES_FILE):
+                conn.execute('INSERT INTO queries (data) VALUES (?)',
+                             (_json_text(q),))
+        conn.execute(
+            "INSERT OR IGNORE INTO meta (key, value) "
+            "VALUES ('legacy_imported', 1)"
+        )
+        conn.execute('COMMIT')
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+
+
+_init_db()
 
 
 def _require_admin():
@@ -126,46 +752,102 @@ def _require_admin():
     """
     if session.get('admin_logged_in'):
         return
-    expected = os.environ.get('ADMIN_TOKEN')
-    if expected:
+    if _ADMIN_TOKEN:
         token = (
             request.args.get('token')
-            or request.form.get('token')
             or request.headers.get('X-Admin-Token')
+            or ''
         )
-        if token == expected:
+        # Admin forms are urlencoded; don't make Werkzeug parse a
+        # multipart upload body just to look for a token in it
+        if (
+            not token
+            and request.mimetype == 'application/x-www-form-urlencoded'
+        ):
+            token = request.form.get('token') or ''
+        # Constant-time compare so the token can't be guessed by timing
+        if secrets.compare_digest(token.encode(), _ADMIN_TOKEN.encode()):
             return
     abort(403)
 
 
+# Parsed updates plus the pre-encoded /api/updates body. The file is
+# stat'ed at most once per UPDATES_CACHE_TTL seconds and only re-read
+# when its mtime/size changed.
+UPDATES_CACHE_TTL = 5.0
+_UPDATES_CACHE: dict = {'checked': 0.0, 'key': None, 'snap': None}
+
+
+def _file_key(path):
+    """(mtime_ns, size) of path, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _updates_file_key():
+    for path in (UPDATES_FILE, os.path.join(DATA_DIR, 'notifications.json')):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        return (path, st.st_mtime_ns, st.st_size)
+    return None
+
+
+def _updates_snapshot():
+    """Return (updates, api_body_bytes, etag), refreshing from disk if
+    needed.
+    """
+    cache = _UPDATES_CACHE
+    now = time.monotonic()
+    snap = cache['snap']
+    if snap is not None and now - cache['checked'] < UPDATES_CACHE_TTL:
+        return snap
+    key = _updates_file_key()
+    if snap is None or key != cache['key']:
+        data = _read_updates_list()
+        body = _json_text({'updates': data}).encode('utf-8')
+        etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        snap = (tuple(data), body, etag)
+        cache.update(key=key, snap=snap)
+    cache['checked'] = now
+    return snap
+
+
 def _load_updates_list():
+    """Return a fresh (mutable) copy of the cached updates list."""
+    return list(_updates_snapshot()[0])
+
+
+def _read_updates_list():
     """Load updates from UPDATES_FILE or legacy notifications.json.
     Returns a list of strings, falling back to a default if empty.
     """
     data = []
     try:
         if os.path.exists(UPDATES_FILE):
-            with open(UPDATES_FILE, 'r', encoding='utf-8') as f:
-                raw = json.load(f)
-                if isinstance(raw, list):
-                    for item in raw:
-                        if isinstance(item, dict):
-                            msg = (
-                                item.get('message')
-                                or item.get('text')
-                                or item.get('title')
-                            )
-                            if msg:
-                                data.append(str(msg))
-                        else:
-                            data.append(str(item))
+            raw = _cached_read_json(UPDATES_FILE)
+            if isinstance(raw, list):
+                for item in raw:
+                    if isinstance(item, dict):
+                        msg = (
+                            item.get('message')
+                            or item.get('text')
+                            or item.get('title')
+                        )
+                        if msg:
+                            data.append(str(msg))
+                    else:
+                        data.append(str(item))
         else:
             legacy_path = os.path.join(DATA_DIR, 'notifications.json')
             if os.path.exists(legacy_path):
-                with open(legacy_path, 'r', encoding='utf-8') as f:
-                    raw = json.load(f)
-                    if isinstance(raw, list):
-                        data = [str(x) for x in raw]
+                raw = _cached_read_json(legacy_path)
+                if isinstance(raw, list):
+                    data = [str(x) for x in raw]
     except Exception:
         data = []
 
@@ -174,29 +856,92 @@ def _load_updates_list():
     return data
 
 
+def _request_epoch_ms() -> int:
+    """Return the current request's wall-clock time in epoch ms (read
+    once). Stored as-is; formatting happens at display time.
+    """
+    if 'request_epoch_ms' not in g:
+        g.request_epoch_ms = time.time_ns() // 1_000_000
+    return g.request_epoch_ms
+
+
+def _request_time() -> datetime:
+    """Return the wall-clock time of the current request as a datetime."""
+    if 'request_time' not in g:
+        g.request_time = datetime.fromtimestamp(_request_epoch_ms() / 1000)
+    return g.request_time
+
+
+def _compute_age(today: date, dob: date) -> int:
+    """Whole years from dob to today (one less if the birthday hasn't
+    come round yet this year).
+    """
+    return (
+        today.year
+        - dob.year
+        - ((today.month, today.day) < (dob.month, dob.day))
+    )
+
+
+@app.template_filter('ts_format')
+def _ts_format(epoch_ms, fallback=''):
+    """Render an epoch-ms timestamp as 'YYYY-mm-dd HH:MM:SS'. Entries
+    saved before timestamps were numeric pass their old string as
+    fallback.
+    """
+    if not epoch_ms:
+        return fallback or ''
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(epoch_ms / 1000))
+
+
+def _not_modified(etag):
+    """Return a bare 304 if the client already holds etag, else None."""
+    if request.if_none_match.contains(etag):
+        resp = Response(status=304)
+        resp.set_etag(etag)
+        resp.headers['Cache-Control'] = 'no-cache'
+        return resp
+    return None
+
+
 @app.route('/')
 def home():
+    # The page depends only on the updates, the site content and the
+    # template itself, so a repeat visit can skip rendering entirely.
+    etag = hashlib.blake2b(repr((
+        _updates_snapshot()[2],
+        _file_key(SITE_CONTENT_FILE),
+        _file_key(os.path.join(app.root_path, 'templates', 'dashboard.html')),
+    )).encode('utf-8'), digest_size=8).hexdigest()
+    not_modified = _not_modified(etag)
+    if not_modified is not None:
+        return not_modified
     update_list = _load_updates_list()
     update = update_list[0] if update_list else 'Registration will open soon.'
-    return render_template(
+    resp = make_response(render_template(
         'dashboard.html',
         update=update,
         updates=update_list,
         site_content=_load_site_content(),
-    )
+    ))
+    resp.set_etag(etag)
+    resp.headers['Cache-Control'] = 'no-cache'
+    return resp
 
 
 @app.route('/api/updates')
 def api_updates():
     """Simple API to verify what updates the server sees.
-    Add no-cache headers so clients always get fresh data.
+    Clients must revalidate every time (no-cache), but a poll whose
+    ETag still matches gets an empty 304 instead of the body.
     """
-    resp = jsonify({'updates': _load_updates_list()})
-    resp.headers['Cache-Control'] = (
-        'no-store, no-cache, must-revalidate, max-age=0'
-    )
-    resp.headers['Pragma'] = 'no-cache'
-    resp.headers['Expires'] = '0'
+    _, body, etag = _updates_snapshot()
+    not_modified = _not_modified(etag)
+    if not_modified is not None:
+        return not_modified
+    resp = Response(body, mimetype='application/json')
+    resp.set_etag(etag)
+    resp.headers['Cache-Control'] = 'no-cache'
     return resp
 
 
@@ -222,13 +967,10 @@ def register():
             if age_from_form:
                 age = int(age_from_form)
             elif dob_str:
-                dob = datetime.strptime(dob_str, '%Y-%m-%d')
-                today = datetime.now()
-                # compute age accounting for whether birthday passed this year
-                age = (
-                    today.year
-                    - dob.year
-                    - ((today.month, today.day) < (dob.month, dob.day))
+                # fromisoformat is a C parser; strptime goes through
+                # Python-level locale/regex machinery
+                age = _compute_age(
+                    _request_time(), date.fromisoformat(dob_str.strip())
                 )
         except Exception:
             age = None
@@ -253,102 +995,12 @@ def register():
             flash("Please select at least 1 and at most 2 positions.", "error")
             return redirect(request.url)
 
-        # Hackathon certificates (required at least one)
-        hackathon_cert_files = request.files.getlist('hackathon_cert[]')
-        hackathon_certificates = []
-        for f in hackathon_cert_files:
-            stored = save_file(f)
-            if stored:
-                hackathon_certificates.append(stored)
-        if not hackathon_certificates:
-            flash("Please upload at least one Hackathon certificate.", "error")
-            return redirect(request.url)
-
-        # Internship certificates (up to 10). Required for graduates,
-        # optional for students.
-        internship_cert_files = request.files.getlist('internship_cert[]')
-        internship_certificates = []
-        for f in internship_cert_files[:10]:
-            stored = save_file(f)
-            if stored:
-                internship_certificates.append(stored)
-        if status == 'Graduate' and not internship_certificates:
-            flash(
-                (
-                    "Please upload at least one Internship certificate "
-                    "(required for graduates)."
-                ),
-                "error",
-            )
-            return redirect(request.url)
-
-        # College ID (students only)
-        college_id_filename = None
-        if status == 'Student':
-            college_id_filename = save_file(request.files.get('college_id'))
-
-        # Dynamic projects
-        project_links = []
-        project_files = []
-        if status == 'Student':
-            link_list = request.form.getlist(
-                'studentProjectsContainer_project_link[]'
-            )
-            file_list = request.files.getlist(
-                'studentProjectsContainer_project_file[]'
-            )
-        else:
-            link_list = request.form.getlist(
-                'graduateProjectsContainer_project_link[]'
-            )
-            file_list = request.files.getlist(
-                'graduateProjectsContainer_project_file[]'
-            )
-        for i in range(max(len(link_list), len(file_list))):
-            link = link_list[i] if i < len(link_list) else ''
-            file = file_list[i] if i < len(file_list) else None
-            if link:
-                project_links.append(link)
-            stored = save_file(file)
-            if stored:
-                project_files.append(stored)
-
-        # Instagram proof (required)
-        insta_filename = save_file(request.files.get('insta_follow_proof'))
-        if not insta_filename:
-            flash("Please upload Instagram follow proof.", "error")
-            return redirect(request.url)
-
-        # LinkedIn proof (required)
-        linkedin_filename = save_file(
-            request.files.get('linkedin_follow_proof')
-        )
-        if not linkedin_filename:
-            flash("Please upload LinkedIn follow proof.", "error")
-            return redirect(request.url)
-
-        # Payment proof (required)
-        payment_proof_filename = save_file(request.files.get('payment_proof'))
-        if not payment_proof_filename:
-            flash("Please upload payment proof.", "error")
-            return redirect(request.url)
-
-        # Profile photo (optional)
-        profile_photo_filename = save_file(request.files.get('profile_photo'))
-
-        # Proof of Identity (mandatory): type + photo
+        # Proof of Identity type (the photo is checked with the uploads)
         id_proof_type = (request.form.get('id_proof_type') or '').strip()
         allowed_id_types = {'Aadhaar Card', 'PAN Card', 'DigiLocker'}
         if id_proof_type not in allowed_id_types:
             flash("Please choose a valid Proof of Identity type.", "error")
             return redirect(request.url)
-        id_proof_file = save_file(request.files.get('id_proof_file'))
-        if not id_proof_file:
-            flash(
-                "Please upload a photo of the selected Proof of Identity.",
-                "error",
-            )
-            return redirect(request.url)
 
         # Socials (mandatory: GitHub, LinkedIn, Instagram)
         social_media = {
@@ -368,12 +1020,114 @@ def register():
             )
             return redirect(request.url)
 
-        # Load existing, assign id, save
-        regs = _load_list(REGISTRATIONS_FILE)
-        next_id = 1 + max([r.get('id', 0) for r in regs] or [0])
+        # Bucket every uploaded file by field name in one pass
+        uploads: dict[str, list] = {}
+        for field, f in request.files.items(multi=True):
+            uploads.setdefault(field, []).append(f)
+
+        # Dynamic projects
+        if status == 'Student':
+            link_list = request.form.getlist(
+                'studentProjectsContainer_project_link[]'
+            )
+            file_list = uploads.get(
+                'studentProjectsContainer_project_file[]', []
+            )
+        else:
+            link_list = request.form.getlist(
+                'graduateProjectsContainer_project_link[]'
+            )
+            file_list = uploads.get(
+                'graduateProjectsContainer_project_file[]', []
+            )
+        project_links = [link for link in link_list if link]
+
+        # Required uploads and the error shown when one is missing.
+        # Internship certificates: required for graduates,
+        # optional for students.
+        required_uploads = [
+            ('hackathon_cert[]',
+             "Please upload at least one Hackathon certificate."),
+            ('internship_cert[]',
+             "Please upload at least one Internship certificate "
+             "(required for graduates)."),
+            ('insta_follow_proof', "Please upload Instagram follow proof."),
+            ('linkedin_follow_proof',
+             "Please upload LinkedIn follow proof."),
+            ('payment_proof', "Please upload payment proof."),
+            ('id_proof_file',
+             "Please upload a photo of the selected Proof of Identity."),
+        ]
+        if status != 'Graduate':
+            del required_uploads[1]
+        # Check the filenames before anything is stored, so a rejected
+        # submission leaves no files behind (unclaimed temp files are
+        # removed when the request closes)
+        for field, message in required_uploads:
+            if not any(
+                f.filename and allowed_file(f.filename)
+                for f in uploads.get(field, [])
+            ):
+                flash(message, "error")
+                return redirect(request.url)
+
+        # Save every upload concurrently, then check the required ones
+        # again: save_file() also rejects content that doesn't match its
+        # extension. Internship certificates are capped at 10; the
+        # College ID is only collected from students.
+        hackathon_cert_files = uploads.get('hackathon_cert[]', [])
+        internship_cert_files = uploads.get('internship_cert[]', [])[:10]
+        single_fields = [
+            'college_id' if status == 'Student' else None,
+            'insta_follow_proof',
+            'linkedin_follow_proof',
+            'payment_proof',
+            'profile_photo',
+            'id_proof_file',
+        ]
+        stored = save_files(
+            hackathon_cert_files
+            + internship_cert_files
+            + file_list
+            + [(uploads.get(k) or [None])[0] for k in single_fields]
+        )
+        n_hack = len(hackathon_cert_files)
+        n_intern = len(internship_cert_files)
+        n_proj = len(file_list)
+        hackathon_certificates = [x for x in stored[:n_hack] if x]
+        internship_certificates = [
+            x for x in stored[n_hack:n_hack + n_intern] if x
+        ]
+        project_files = [
+            x for x in stored[n_hack + n_intern:n_hack + n_intern + n_proj]
+            if x
+        ]
+        (
+            college_id_filename,
+            insta_filename,
+            linkedin_filename,
+            payment_proof_filename,
+            profile_photo_filename,
+            id_proof_file,
+        ) = stored[n_hack + n_intern + n_proj:]
+
+        stored_required = {
+            'hackathon_cert[]': hackathon_certificates,
+            'internship_cert[]': internship_certificates,
+            'insta_follow_proof': insta_filename,
+            'linkedin_follow_proof': linkedin_filename,
+            'payment_proof': payment_proof_filename,
+            'id_proof_file': id_proof_file,
+        }
+        for field, message in required_uploads:
+            if not stored_required[field]:
+                discard_files(stored)
+                flash(message, "error")
+                return redirect(request.url)
+
+        # The database assigns the id on insert
         registration = {
-            'id': next_id,
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp_unix': _request_epoch_ms(),
             'fullname': fullname,
             'email': email,
             'contact': contact,
@@ -398,8 +1152,7 @@ def register():
             'internship_certificates': internship_certificates,
             'social_media': social_media,
         }
-        regs.insert(0, registration)
-        _save_list(REGISTRATIONS_FILE, regs)
+        _enqueue_registration(registration)
 
         flash("Registration submitted successfully!", "success")
         return redirect(url_for('register'))
@@ -417,14 +1170,12 @@ def contact():
             flash("Please fill all fields.", "error")
             return redirect(request.url)
 
-        qs = _load_list(QUERIES_FILE)
-        qs.append({
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        _insert_query({
+            'timestamp_unix': _request_epoch_ms(),
             'name': name,
             'email': email,
             'message': message,
         })
-        _save_list(QUERIES_FILE, qs)
         flash("Your query has been submitted successfully!", "success")
         return redirect(url_for('contact'))
 
@@ -438,44 +1189,41 @@ def _default_admin_credentials():
 
 
 def _load_admin_credentials():
+    """Return {'username', 'password_hash'}; the file stores only the
+    scrypt hash. Files from before hashing (plaintext 'password') are
+    rewritten in the new format on first load.
+    """
     try:
         if os.path.exists(ADMIN_CREDENTIALS_FILE):
-            with open(ADMIN_CREDENTIALS_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if (
-                    isinstance(data, dict)
-                    and data.get('username')
-                    and data.get('password')
-                ):
+            data = _cached_read_json(ADMIN_CREDENTIALS_FILE)
+            if isinstance(data, dict) and data.get('username'):
+                if data.get('password_hash'):
                     return data
+                if data.get('password'):
+                    return _save_admin_credentials(data)
     except Exception:
         pass
     # Initialize with defaults if missing or invalid
-    creds = _default_admin_credentials()
-    _save_admin_credentials(creds)
-    return creds
+    return _save_admin_credentials(_default_admin_credentials())
 
 
-def _save_admin_credentials(creds: dict):
+def _save_admin_credentials(creds: dict) -> dict:
+    """Store creds, hashing a plaintext 'password' if one is given."""
+    defaults = _default_admin_credentials()
+    password_hash = creds.get('password_hash')
+    if creds.get('password') or not password_hash:
+        password_hash = generate_password_hash(
+            creds.get('password') or defaults['password'], method='scrypt'
+        )
+    data = {
+        'username': creds.get('username') or defaults['username'],
+        'password_hash': password_hash,
+    }
     try:
-        with open(ADMIN_CREDENTIALS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(
-                {
-                    'username': (
-                        creds.get('username')
-                        or _default_admin_credentials()['username']
-                    ),
-                    'password': (
-                        creds.get('password')
-                        or _default_admin_credentials()['password']
-                    ),
-                },
-                f,
-                ensure_ascii=False,
-                indent=2,
-            )
+        _write_json(ADMIN_CREDENTIALS_FILE, data)
     except Exception:
         pass
+    return data
 
 
 @app.route('/admin/login', methods=['GET', 'POST'])
@@ -484,10 +1232,12 @@ def admin_login():
         username = request.form.get('username', '').strip()
         password = request.form.get('password', '').strip()
         creds = _load_admin_credentials()
-        if (
-            username == creds.get('username')
-            and password == creds.get('password')
-        ):
+        # Always run the hash check so a wrong username costs the same
+        user_ok = secrets.compare_digest(
+            username.encode('utf-8'), creds['username'].encode('utf-8')
+        )
+        pass_ok = check_password_hash(creds['password_hash'], password)
+        if user_ok and pass_ok:
             session['admin_logged_in'] = True
             session['admin_username'] = username
             flash('Logged in successfully.', 'success')
@@ -509,7 +1259,9 @@ def admin_logout():
 def admin_dashboard():
     if not session.get('admin_logged_in'):
         return redirect(url_for('admin_login'))
-    updates = _load_updates_list()
+    # Not the TTL snapshot: the delete buttons post indices into this
+    # list, so it has to match what's on disk
+    updates = _read_updates_list()
     return render_template(
         'admin_dashboard.html',
         updates=updates,
@@ -522,12 +1274,15 @@ def admin_dashboard():
 
 
 def _save_updates_list(items: list[str]):
-    """Persist updates as a list of strings to UPDATES_FILE."""
+    """Persist updates as a list of strings to UPDATES_FILE. The caller
+    holds _file_lock(UPDATES_FILE) across its read and this write.
+    """
     try:
-        with open(UPDATES_FILE, 'w', encoding='utf-8') as f:
-            json.dump(items, f, ensure_ascii=False, indent=2)
+        _write_json(UPDATES_FILE, items, locked=True)
     except Exception:
         pass
+    # Make this worker's next read pick up the change immediately
+    _UPDATES_CACHE['snap'] = None
 
 
 @app.route('/admin/updates/add', methods=['POST'])
@@ -537,9 +1292,12 @@ def admin_add_update():
     if not msg:
         flash('Update message cannot be empty.', 'error')
         return redirect(url_for('admin_dashboard'))
-    items = _load_updates_list()
-    items.insert(0, msg)
-    _save_updates_list(items)
+    # Read what's on disk now (not the TTL snapshot) and keep other
+    # workers out until the new list is written
+    with _file_lock(UPDATES_FILE):
+        items = _read_updates_list()
+        items.insert(0, msg)
+        _save_updates_list(items)
     flash('Update added.', 'success')
     return redirect(url_for('admin_dashboard'))
 
@@ -547,10 +1305,13 @@ def admin_add_update():
 @app.route('/admin/updates/delete/<int:index>', methods=['POST'])
 def admin_delete_update(index: int):
     _require_admin()
-    items = _load_updates_list()
-    if 0 <= index < len(items):
-        items.pop(index)
-        _save_updates_list(items)
+    with _file_lock(UPDATES_FILE):
+        items = _read_updates_list()
+        valid = 0 <= index < len(items)
+        if valid:
+            items.pop(index)
+            _save_updates_list(items)
+    if valid:
         flash('Update deleted.', 'success')
     else:
         flash('Invalid update index.', 'error')
@@ -649,37 +1410,61 @@ def _default_site_content():
     }
 
 
+_DEFAULT_SITE_CONTENT = _default_site_content()
+# Last merge result, reused while the parsed file is the same object
+_SITE_CONTENT_CACHE: dict = {'src': None, 'merged': None}
+
+
+def _overlay(base: dict, data) -> dict:
+    """Shallow {**base, **data}, ignoring None values in data."""
+    if not isinstance(data, dict):
+        return base
+    out = dict(base)
+    out.update((k, v) for k, v in data.items() if v is not None)
+    return out
+
+
+def _merge_site_content(data) -> dict:
+    """Overlay saved content on the defaults, one level per section so
+    keys missing from the file keep their default.
+    """
+    out = _overlay(_DEFAULT_SITE_CONTENT, data)
+    for key, default in _DEFAULT_SITE_CONTENT.items():
+        if isinstance(default, dict) and isinstance(out[key], dict):
+            out[key] = _overlay(default, out[key])
+    page = out['registerPage']
+    if isinstance(page, dict) and isinstance(page.get('fee'), dict):
+        page['fee'] = _overlay(
+            _DEFAULT_SITE_CONTENT['registerPage']['fee'], page['fee']
+        )
+    return out
+
+
 def _load_site_content():
+    """Return the merged site content. The dict is shared between
+    requests: deep-copy it before editing.
+    """
     try:
         if os.path.exists(SITE_CONTENT_FILE):
-            with open(SITE_CONTENT_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Merge with defaults to ensure keys exist
-                base = _default_site_content()
-
-                def merge(a, b):
-                    if isinstance(a, dict) and isinstance(b, dict):
-                        out = dict(a)
-                        for k, v in b.items():
-                            out[k] = merge(out.get(k), v)
-                        return out
-                    return b if b is not None else a
-                return merge(base, data)
+            data = _cached_read_json(SITE_CONTENT_FILE)
+            cache = _SITE_CONTENT_CACHE
+            if cache['src'] is not data:
+                cache.update(merged=_merge_site_content(data), src=data)
+            return cache['merged']
     except Exception:
         pass
-    return _default_site_content()
+    return _DEFAULT_SITE_CONTENT
 
 
 def _save_site_content(data: dict):
     os.makedirs(os.path.dirname(SITE_CONTENT_FILE), exist_ok=True)
-    with open(SITE_CONTENT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    _write_json(SITE_CONTENT_FILE, data)
 
 
 @app.route('/admin/settings/site_content', methods=['POST'])
 def admin_save_site_content():
     _require_admin()
-    content = _load_site_content()
+    content = copy.deepcopy(_load_site_content())
     # Hero
     content['hero']['badge'] = (
         (request.form.get('hero_badge') or '').strip()
@@ -794,45 +1579,60 @@ def admin_save_site_content():
     return redirect(url_for('admin_dashboard'))
 
 
+# Rendered admin list pages, keyed on the endpoint, the full request
+# path (templates echo the query string) and the registrations version,
+# so any write invalidates them without explicit bookkeeping.
+RENDER_CACHE_SIZE = 32
+_RENDER_CACHE: OrderedDict = OrderedDict()
+_RENDER_CACHE_LOCK = threading.Lock()
+
+
+def _cached_render(render, *key_extra):
+    """Return render()'s HTML, reusing a previous render while the data
+    it was built from is unchanged.
+    """
+    if session.get('_flashes'):
+        # Pending flash messages are consumed by the render itself
+        return render()
+    key = (
+        request.endpoint, request.full_path, _registrations_version()
+    ) + key_extra
+    with _RENDER_CACHE_LOCK:
+        html = _RENDER_CACHE.get(key)
+        if html is not None:
+            _RENDER_CACHE.move_to_end(key)
+            return html
+    html = render()
+    with _RENDER_CACHE_LOCK:
+        _RENDER_CACHE[key] = html
+        while len(_RENDER_CACHE) > RENDER_CACHE_SIZE:
+            _RENDER_CACHE.popitem(last=False)
+    return html
+
+
 @app.route('/admin/registrations')
 def view_registrations():
     _require_admin()
     # Show only pending entries on the main registrations page
-    regs = [
-        r for r in _load_list(REGISTRATIONS_FILE)
-        if r.get('review_status') == 'pending'
-    ]
-    return render_template('registrations.html', registrations=regs)
+    return _cached_render(lambda: render_template(
+        'registrations.html', registrations=_list_registrations('pending')
+    ))
 
 
 def _set_review_status(reg_id: int, new_status: str):
-    regs = _load_list(REGISTRATIONS_FILE)
-    updated = False
-    for r in regs:
-        if r.get('id') == reg_id:
-            r['review_status'] = new_status
-            updated = True
-            break
-    if updated:
-        _save_list(REGISTRATIONS_FILE, regs)
-    return updated
+    return _update_registration(reg_id, review_status=new_status)
 
 
 def _set_selected_with_position(reg_id: int, position: str):
     """Set a registration to selected with a chosen position.
     Returns True if updated, else False.
     """
-    regs = _load_list(REGISTRATIONS_FILE)
-    for r in regs:
-        if r.get('id') == reg_id:
-            positions = r.get('positions') or []
-            if position not in positions:
-                return False
-            r['review_status'] = 'selected'
-            r['selected_position'] = position
-            _save_list(REGISTRATIONS_FILE, regs)
-            return True
-    return False
+    r = _get_registration(reg_id)
+    if r is None or position not in (r.get('positions') or []):
+        return False
+    return _update_registration(
+        reg_id, review_status='selected', selected_position=position
+    )
 
 
 @app.route('/admin/registrations/select/<int:reg_id>', methods=['POST'])
@@ -886,64 +1686,279 @@ def pause_registration(reg_id):
 @app.route('/admin/selected')
 def view_selected():
     _require_admin()
-    all_regs = _load_list(REGISTRATIONS_FILE)
-    regs = [r for r in all_regs if r.get('review_status') == 'selected']
     pos = request.args.get('position')
-    if pos:
-        regs = [r for r in regs if r.get('selected_position') == pos]
     # Use the canonical positions list for consistent filters
     positions = POSITIONS
-    return render_template('selected.html',
-                           registrations=regs,
-                           positions=positions,
-                           active_position=pos)
+    return _cached_render(lambda: render_template(
+        'selected.html',
+        registrations=_list_registrations('selected', position=pos),
+        positions=positions,
+        active_position=pos,
+    ))
 
 
 @app.route('/admin/positions')
 def view_positions():
     """View selected candidates grouped (or filtered) by selected_position."""
     _require_admin()
-    all_regs = _load_list(REGISTRATIONS_FILE)
-    selected_regs = [
-        r for r in all_regs if r.get('review_status') == 'selected'
-    ]
-    # Build groups by selected_position, ensuring all known positions exist
-    groups = {p: [] for p in POSITIONS}
-    for r in selected_regs:
-        pos = r.get('selected_position')
-        if pos in groups:
-            groups[pos].append(r)
-
     # Optional filter via query string ?position=
     active = request.args.get('position')
-    templates = _load_mail_templates()
-    if active:
-        filtered = {active: groups.get(active, [])}
+
+    def render():
+        templates = _load_mail_templates()
+        if active:
+            # Only that position's rows, straight off the index
+            filtered = {
+                active: (
+                    _list_registrations('selected', position=active)
+                    if active in POSITIONS else []
+                )
+            }
+            return render_template(
+                'positions.html',
+                groups=filtered,
+                positions=POSITIONS,
+                active_position=active,
+                mail_templates=templates,
+            )
+
+        # Build groups by selected_position, ensuring all known
+        # positions exist
+        groups = {p: [] for p in POSITIONS}
+        for r in _list_registrations('selected'):
+            pos = r.get('selected_position')
+            if pos in groups:
+                groups[pos].append(r)
+
         return render_template(
             'positions.html',
-            groups=filtered,
+            groups=groups,
             positions=POSITIONS,
-            active_position=active,
+            active_position=None,
             mail_templates=templates,
         )
 
-    # Load mail templates for UI defaults
-    # (already loaded above as 'templates')
-
-    return render_template(
-        'positions.html',
-        groups=groups,
-        positions=POSITIONS,
-        active_position=None,
-        mail_templates=templates,
-    )
+    # The page also shows each position's saved mail template
+    return _cached_render(render, _file_key(MAIL_TEMPLATES_FILE))
 
 
 # --- EMAIL UTILITIES ---
+def _env_number(name: str, default, cast):
+    """Parse a numeric env var, falling back to default if unset/bad."""
+    try:
+        return cast(os.environ.get(name) or default)
+    except ValueError:
+        return default
+
+
+# SMTP settings, read once at import (after load_dotenv)
+SMTP_HOST = os.environ.get('SMTP_HOST')
+SMTP_FROM = os.environ.get('SMTP_FROM')
+SMTP_PORT = _env_number('SMTP_PORT', 587, int)
+SMTP_USER = os.environ.get('SMTP_USER')
+SMTP_PASSWORD = os.environ.get('SMTP_PASSWORD')
+SMTP_USE_TLS = os.environ.get('SMTP_USE_TLS', 'true').lower() in (
+    '1', 'true', 'yes', 'on'
+)
+SMTP_BATCH_SIZE = _env_number('SMTP_BATCH_SIZE', 50, int)
+SMTP_BATCH_DELAY = _env_number('SMTP_BATCH_DELAY', 0.0, float)
+# Parallel SMTP sessions per worker process for large broadcasts
+SMTP_POOL_SIZE = max(1, _env_number('SMTP_POOL_SIZE', 1, int))
+
+
 def _smtp_configured():
-    return bool(
-        os.environ.get('SMTP_HOST') and os.environ.get('SMTP_FROM')
-    )
+    return bool(SMTP_HOST and SMTP_FROM)
+
+
+# Idle SMTP sessions kept per worker process and reused across sends,
+# so bulk mail doesn't pay the TCP + STARTTLS + AUTH handshake every
+# time. A session is checked out by one thread at a time (smtplib isn't
+# thread-safe) and returned to the pool afterwards.
+_SMTP_IDLE: list[smtplib.SMTP] = []
+_SMTP_IDLE_LOCK = threading.Lock()
+
+
+def _quit_smtp(conn: smtplib.SMTP):
+    try:
+        conn.quit()
+    except Exception:
+        conn.close()
+
+
+def _open_smtp() -> smtplib.SMTP:
+    """Connect, EHLO, STARTTLS and log in with the SMTP_* settings."""
+    server = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=30)
+    try:
+        server.ehlo()
+        if SMTP_USE_TLS:
+            try:
+                server.starttls()
+                server.ehlo()
+            except Exception:
+                # continue even if TLS not supported
+                pass
+        if SMTP_USER and SMTP_PASSWORD:
+            server.login(SMTP_USER, SMTP_PASSWORD)
+    except BaseException:
+        server.close()
+        raise
+    return server
+
+
+def _checkout_smtp() -> smtplib.SMTP:
+    """Take an idle session that still answers NOOP, or open one."""
+    while True:
+        with _SMTP_IDLE_LOCK:
+            conn = _SMTP_IDLE.pop() if _SMTP_IDLE else None
+        if conn is None:
+            return _open_smtp()
+        try:
+            if conn.noop()[0] == 250:
+                return conn
+        except (smtplib.SMTPException, OSError):
+            pass
+        _quit_smtp(conn)
+
+
+def _checkin_smtp(conn: smtplib.SMTP):
+    with _SMTP_IDLE_LOCK:
+        if len(_SMTP_IDLE) < SMTP_POOL_SIZE:
+            _SMTP_IDLE.append(conn)
+            return
+    _quit_smtp(conn)
+
+
+@atexit.register
+def _close_smtp_pool():
+    """QUIT every idle session when the process shuts down."""
+    with _SMTP_IDLE_LOCK:
+        conns = list(_SMTP_IDLE)
+        _SMTP_IDLE.clear()
+    for conn in conns:
+        _quit_smtp(conn)
+
+
+def _sendmail_pipelined(conn, from_addr, rcpts, raw: bytes) -> dict:
+    """Send raw to rcpts with MAIL FROM, every RCPT TO and DATA written
+    in one go (RFC 2920 PIPELINING) and the replies read afterwards,
+    instead of one round trip per command as smtplib does. Returns the
+    refused recipients like sendmail(); raises like sendmail() when the
+    message can't be sent at all.
+    """
+    lines = [f'MAIL FROM:{smtplib.quoteaddr(from_addr)}']
+    lines += [f'RCPT TO:{smtplib.quoteaddr(r)}' for r in rcpts]
+    lines.append('DATA')
+    conn.send(''.join(line + '\r\n' for line in lines))
+    replies = [conn.getreply() for _ in lines]
+    mail_code, mail_resp = replies[0]
+    data_code, data_resp = replies[-1]
+    refused = {
+        r: reply for r, reply in zip(rcpts, replies[1:-1])
+        if reply[0] not in (250, 251)
+    }
+    delivering = mail_code == 250 and len(refused) < len(rcpts)
+    if data_code == 354:
+        if not delivering:
+            # DATA was accepted although nothing can be delivered: end
+            # it empty so the session stays in step
+            conn.send(b'.\r\n')
+            conn.getreply()
+        else:
+            # Dot-stuff and terminate the body, as SMTP.data() does
+            body = re.sub(rb'(?m)^\.', b'..', raw)
+            if not body.endswith(b'\r\n'):
+                body += b'\r\n'
+            conn.send(body + b'.\r\n')
+            code, resp = conn.getreply()
+            if code != 250:
+                conn.rset()
+                raise smtplib.SMTPDataError(code, resp)
+            return refused
+    conn.rset()
+    if mail_code != 250:
+        raise smtplib.SMTPSenderRefused(mail_code, mail_resp, from_addr)
+    if not delivering:
+        raise smtplib.SMTPRecipientsRefused(refused)
+    raise smtplib.SMTPDataError(data_code, data_resp)
+
+
+def _send_chunk(conn, msg, raw, from_addr, chunk):
+    """Send msg (raw: its SMTP wire bytes) to one BCC chunk, pipelining
+    the envelope when the server supports it. The pre-serialized bytes
+    are reused for every chunk; only non-ASCII addresses, which need
+    send_message()'s SMTPUTF8 handling, serialize msg again.
+    Returns the refused recipients ({address: (code, reply)}).
+    """
+    if not (from_addr.isascii() and all(r.isascii() for r in chunk)):
+        return conn.send_message(msg, from_addr=from_addr, to_addrs=chunk)
+    if conn.has_extn('pipelining'):
+        return _sendmail_pipelined(conn, from_addr, chunk, raw)
+    return conn.sendmail(from_addr, chunk, raw)
+
+
+def _send_chunks(msg, from_addr, chunks, delay=0.0):
+    """Send msg to each recipient chunk in turn on one pooled session.
+    Returns (sent_count, error_messages); addresses the server refuses
+    are left out of the count and listed in one error message.
+    """
+    sent, errors, refused_all = 0, [], []
+    try:
+        conn = _checkout_smtp()
+    except Exception as e:
+        return 0, [str(e)]
+    raw = msg.as_bytes(policy=email_policy.SMTP)
+    for i, chunk in enumerate(chunks):
+        if i and delay > 0:
+            time.sleep(delay)
+        try:
+            try:
+                refused = _send_chunk(conn, msg, raw, from_addr, chunk)
+            except smtplib.SMTPServerDisconnected:
+                # Dropped between chunks (idle timeout, server
+                # restart): reconnect once and retry this chunk
+                _quit_smtp(conn)
+                conn = None
+                conn = _open_smtp()
+                refused = _send_chunk(conn, msg, raw, from_addr, chunk)
+        except smtplib.SMTPRecipientsRefused as e:
+            # No address in this chunk was accepted, but the session is
+            # still fine for the next one
+            refused = e.recipients
+        except Exception as e:
+            errors.append(str(e))
+            if conn is not None and isinstance(
+                e, smtplib.SMTPServerDisconnected
+            ):
+                _quit_smtp(conn)
+                conn = None
+            if conn is None:
+                # No usable session left for the remaining chunks
+                break
+            continue
+        sent += len(chunk) - len(refused)
+        refused_all.extend(refused)
+    if conn is not None:
+        _checkin_smtp(conn)
+    if refused_all:
+        errors.append('Refused recipients: ' + ', '.join(refused_all))
+    return sent, errors
+
+
+def _unique_recipients(recipients: Iterable[str]) -> list[str]:
+    """Normalized (stripped, lowercased) addresses in first-seen order,
+    without duplicates, blanks or strings that can't be an address.
+    """
+    seen = set()
+    out = []
+    for e in recipients:
+        if not e:
+            continue
+        addr = e.strip().lower()
+        if addr in seen or '@' not in addr:
+            continue
+        seen.add(addr)
+        out.append(addr)
+    return out
 
 
 def _send_bulk_email(
@@ -954,79 +1969,176 @@ def _send_bulk_email(
     delay_seconds: float | int = 0,
 ):
     """Send a single email to multiple recipients via BCC.
-    Uses environment variables:
+    Uses the SMTP_* settings read from the environment at import:
       SMTP_HOST (required), SMTP_PORT (optional, default 587),
       SMTP_USER (optional), SMTP_PASSWORD (optional),
       SMTP_USE_TLS (optional, 'true'/'false', default 'true'),
-      SMTP_FROM (required)
+      SMTP_FROM (required), SMTP_POOL_SIZE (optional, default 1)
+    With SMTP_POOL_SIZE > 1 and no batch delay, the BCC chunks are
+    spread over that many sessions sending in parallel.
     Returns (sent_count, error_message_or_None)
     """
-    host = os.environ.get('SMTP_HOST')
-    from_addr = os.environ.get('SMTP_FROM')
-    if not host or not from_addr:
+    from_addr = SMTP_FROM
+    if not SMTP_HOST or not from_addr:
         return 0, 'SMTP is not configured (missing SMTP_HOST/SMTP_FROM).'
 
-    port = int(os.environ.get('SMTP_PORT', '587'))
-    user = os.environ.get('SMTP_USER')
-    password = os.environ.get('SMTP_PASSWORD')
-    use_tls = str(os.environ.get('SMTP_USE_TLS', 'true')).lower() in (
-        '1', 'true', 'yes', 'on'
-    )
-
-    to_list = list({e.strip().lower() for e in recipients if e})
+    to_list = _unique_recipients(recipients)
     if not to_list:
         return 0, None
     # batching
     try:
-        bsz = int(batch_size) if batch_size else int(
-            os.environ.get('SMTP_BATCH_SIZE', '50')
-        )
+        bsz = int(batch_size) if batch_size else SMTP_BATCH_SIZE
     except Exception:
         bsz = 50
     try:
-        delay = float(delay_seconds) if delay_seconds else float(
-            os.environ.get('SMTP_BATCH_DELAY', '0')
-        )
+        delay = float(delay_seconds) if delay_seconds else SMTP_BATCH_DELAY
     except Exception:
         delay = 0.0
+    bsz = max(1, bsz)
+    chunks = [to_list[i:i + bsz] for i in range(0, len(to_list), bsz)]
+
+    # Every chunk gets the same message; only the envelope differs
+    msg = EmailMessage()
+    msg['Subject'] = subject or '(no subject)'
+    # some servers require a To: address even if BCC is used
+    msg['To'] = from_addr
+    msg['From'] = from_addr
+    msg.set_content(body or '')
+
+    # A batch delay is a rate limit, so it keeps the send sequential
+    workers = 1 if delay > 0 else min(SMTP_POOL_SIZE, len(chunks))
+    if workers <= 1:
+        sent, errors = _send_chunks(msg, from_addr, chunks, delay)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(
+                lambda part: _send_chunks(msg, from_addr, part),
+                [chunks[k::workers] for k in range(workers)],
+            ))
+        sent = sum(n for n, _ in results)
+        errors = [e for _, errs in results for e in errs]
+    if errors:
+        return sent, '; '.join(errors)
+    return sent, None
+
+
+# Mail is sent by a background thread so the admin POST can redirect
+# straight away instead of waiting out the whole SMTP conversation. The
+# worker outlives requests, so the pooled sessions stay open between
+# jobs. Job records live in the mail_jobs table, so /admin/mail/status
+# sees the jobs of every worker process; finished jobs beyond the last
+# MAIL_RESULTS_KEEP are dropped.
+MAIL_RESULTS_KEEP = 50
+_MAIL_JOB_COLUMNS = (
+    'id', 'subject', 'recipients', 'status', 'sent', 'error', 'queued',
+    'finished',
+)
+_MAIL_QUEUE: queue.Queue = queue.Queue()
+_MAIL_WORKER: threading.Thread | None = None
+_MAIL_WORKER_LOCK = threading.Lock()
+
+
+def _update_mail_job(job_id: str, **fields):
+    assignments = ', '.join(f'{k} = ?' for k in fields)
+    _db().execute(
+        f'UPDATE mail_jobs SET {assignments} WHERE id = ?',
+        (*fields.values(), job_id),
+    )
+
 
+def _run_mail_job(job_id: str, subject: str, body: str,
+                  recipients: list[str]):
+    _update_mail_job(job_id, status='sending')
     try:
-        with smtplib.SMTP(host, port, timeout=30) as server:
-            server.ehlo()
-            if use_tls:
-                try:
-                    server.starttls()
-                    server.ehlo()
-                except Exception:
-                    # continue even if TLS not supported
-                    pass
-            if user and password:
-                server.login(user, password)
-            sent = 0
-            errors: list[str] = []
-            # Iterate in chunks
-            for i in range(0, len(to_list), max(1, bsz)):
-                chunk = to_list[i:i + max(1, bsz)]
-                msg = EmailMessage()
-                msg['Subject'] = subject or '(no subject)'
-                # some servers require a To: address even if BCC is used
-                msg['To'] = from_addr
-                msg['From'] = from_addr
-                msg.set_content(body or '')
-                try:
-                    server.send_message(
-                        msg, from_addr=from_addr, to_addrs=chunk
-                    )
-                    sent += len(chunk)
-                except Exception as be:
-                    errors.append(str(be))
-                if delay > 0 and i + bsz < len(to_list):
-                    time.sleep(delay)
-        if errors:
-            return sent, '; '.join(errors)
-        return sent, None
+        sent, err = _send_bulk_email(subject, body, recipients)
     except Exception as e:
-        return 0, str(e)
+        app.logger.exception('Mail job %s failed', job_id)
+        sent, err = 0, str(e)
+    if err:
+        app.logger.warning('Mail job %s: %s', job_id, err)
+    _update_mail_job(
+        job_id,
+        status='sent' if not err else 'partial' if sent else 'failed',
+        sent=sent,
+        error=err,
+        finished=datetime.now().isoformat(timespec='seconds'),
+    )
+
+
+def _mail_worker_loop():
+    while True:
+        job = _MAIL_QUEUE.get()
+        try:
+            _run_mail_job(*job)
+        except Exception:
+            app.logger.exception('Mail job %s failed', job[0])
+        finally:
+            _MAIL_QUEUE.task_done()
+
+
+def _enqueue_mail(subject: str, body: str,
+                  recipients: Iterable[str]) -> dict:
+    """Queue a bulk send for the mail worker; returns its status record."""
+    global _MAIL_WORKER
+    recipients = _unique_recipients(recipients)
+    with _MAIL_WORKER_LOCK:
+        # Started lazily so each (forked) worker process gets its own
+        if _MAIL_WORKER is None or not _MAIL_WORKER.is_alive():
+            _MAIL_WORKER = threading.Thread(
+                target=_mail_worker_loop, name='mail-worker', daemon=True
+            )
+            _MAIL_WORKER.start()
+    job = {
+        'id': uuid.uuid4().hex,
+        'subject': subject,
+        'recipients': len(recipients),
+        'status': 'queued',
+        'queued': datetime.now().isoformat(timespec='seconds'),
+    }
+    conn = _db()
+    conn.execute(
+        'INSERT INTO mail_jobs (id, subject, recipients, status, queued) '
+        'VALUES (:id, :subject, :recipients, :status, :queued)',
+        job,
+    )
+    # Trim only finished jobs; queued/sending ones still get updated
+    conn.execute(
+        "DELETE FROM mail_jobs WHERE status IN ('sent', 'partial', 'failed') "
+        'AND rowid NOT IN '
+        '(SELECT rowid FROM mail_jobs ORDER BY rowid DESC LIMIT ?)',
+        (MAIL_RESULTS_KEEP,),
+    )
+    _MAIL_QUEUE.put((job['id'], subject, body, recipients))
+    return job
+
+
+@atexit.register
+def _flush_mail_queue():
+    """Let the worker finish queued mail before the process exits."""
+    if _MAIL_WORKER is not None and _MAIL_WORKER.is_alive():
+        _MAIL_QUEUE.join()
+
+
+@app.route('/admin/mail/status')
+def mail_status():
+    """Outcome of recent mail jobs, newest first (?id= for just one)."""
+    _require_admin()
+    job_id = request.args.get('id')
+    sql = f'SELECT {", ".join(_MAIL_JOB_COLUMNS)} FROM mail_jobs'
+    args = []
+    if job_id:
+        sql += ' WHERE id = ?'
+        args.append(job_id)
+    sql += ' ORDER BY rowid DESC'
+    jobs = [
+        dict(zip(_MAIL_JOB_COLUMNS, row))
+        for row in _db().execute(sql, args)
+    ]
+    if job_id and not jobs:
+        abort(404)
+    resp = jsonify({'jobs': jobs})
+    resp.headers['Cache-Control'] = 'no-store'
+    return resp
 
 
 @app.route('/admin/positions/send_mail', methods=['POST'])
@@ -1041,13 +2153,14 @@ def send_mail_to_position():
         token = request.args.get('token') or request.form.get('token')
         return redirect(url_for('view_positions', token=token))
 
-    # Get selected candidates for this position
-    regs = [
-        r for r in _load_list(REGISTRATIONS_FILE)
-        if r.get('review_status') == 'selected'
-        and r.get('selected_position') == position
-    ]
-    recipients = [r.get('email') for r in regs if r.get('email')]
+    # Emails of the selected candidates for this position, streamed from
+    # the index-filtered rows (no registration JSON is decoded) straight
+    # into _enqueue_mail's dedup pass
+    recipients = (
+        email for email, in _registration_field_rows(
+            ('email',), 'selected', position
+        )
+    )
 
     # If subject/body not provided, use saved template for this position
     tmpl = _load_mail_templates().get(position, {})
@@ -1071,75 +2184,87 @@ def send_mail_to_position():
             'view_positions', token=token, position=position
         ))
 
-    sent_count, err = _send_bulk_email(subject, body, recipients)
-    if err:
-        flash(f'Failed to send email: {err}', 'error')
-    else:
-        flash(
-            (
-                f'Sent email to {sent_count} recipient(s) '
-                f'for {position}.'
-            ),
-            'success',
-        )
+    job = _enqueue_mail(subject, body, recipients)
+    flash(
+        (
+            f'Email to {job["recipients"]} recipient(s) '
+            f'for {position} queued for delivery.'
+        ),
+        'success',
+    )
 
     token = request.args.get('token') or request.form.get('token')
     return redirect(url_for('view_positions', token=token, position=position))
 
 
 # --- MAIL TEMPLATES LOAD/SAVE ---
+_DEFAULT_MAIL_TEMPLATES = {
+    p: {
+        'subject': f"Update for {p}",
+        'body': (
+            "Hello,\n\n"
+            "This is an update regarding your selection for "
+            f"{p}.\n"
+            "We will share next steps shortly.\n\n"
+            "Regards,\nTeam"
+        ),
+    }
+    for p in POSITIONS
+}
+
+
 def _default_mail_templates():
-    base = {}
-    for p in POSITIONS:
-        base[p] = {
-            'subject': f"Update for {p}",
-            'body': (
-                "Hello,\n\n"
-                "This is an update regarding your selection for "
-                f"{p}.\n"
-                "We will share next steps shortly.\n\n"
-                "Regards,\nTeam"
-            ),
-        }
-    return base
+    return copy.deepcopy(_DEFAULT_MAIL_TEMPLATES)
+
+
+# Last defaults-filled templates, reused while the parsed file is the
+# same object
+_MAIL_TEMPLATES_CACHE: dict = {'src': None, 'filled': None}
 
 
 def _load_mail_templates():
+    """Return the templates with every position filled in. The dict is
+    shared between requests: deep-copy it before editing.
+    """
     # Ensure file exists with defaults
+    src = None
     try:
         if not os.path.exists(MAIL_TEMPLATES_FILE):
             data = _default_mail_templates()
             _save_mail_templates(data)
             return data
-        with open(MAIL_TEMPLATES_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            if not isinstance(data, dict):
-                data = {}
+        src = _cached_read_json(MAIL_TEMPLATES_FILE)
     except Exception:
-        data = {}
+        pass
+    cache = _MAIL_TEMPLATES_CACHE
+    if src is not None and cache['src'] is src:
+        return cache['filled']
+    data = copy.deepcopy(src) if isinstance(src, dict) else {}
 
     # Fill missing positions with defaults
     changed = False
     for p in POSITIONS:
+        default = _DEFAULT_MAIL_TEMPLATES[p]
         if p not in data or not isinstance(data.get(p), dict):
-            data[p] = _default_mail_templates()[p]
+            data[p] = dict(default)
             changed = True
         else:
             if 'subject' not in data[p]:
-                data[p]['subject'] = _default_mail_templates()[p]['subject']
+                data[p]['subject'] = default['subject']
                 changed = True
             if 'body' not in data[p]:
-                data[p]['body'] = _default_mail_templates()[p]['body']
+                data[p]['body'] = default['body']
                 changed = True
     if changed:
         _save_mail_templates(data)
+    if src is not None:
+        cache.update(filled=data, src=src)
     return data
 
 
 def _save_mail_templates(data: dict):
     os.makedirs(os.path.dirname(MAIL_TEMPLATES_FILE), exist_ok=True)
-    with open(MAIL_TEMPLATES_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    _write_json(MAIL_TEMPLATES_FILE, data)
 
 
 @app.route('/admin/positions/save_template', methods=['POST'])
@@ -1151,7 +2276,7 @@ def save_mail_template():
     if not position:
         flash('Position is required.', 'error')
     else:
-        data = _load_mail_templates()
+        data = copy.deepcopy(_load_mail_templates())
         data[position] = {
             'subject': subject or data.get(position, {}).get('subject', ''),
             'body': body or data.get(position, {}).get('body', ''),
@@ -1170,7 +2295,7 @@ def save_mail_templates_bulk():
       lowercased position with spaces replaced by underscores.
     """
     _require_admin()
-    data = _load_mail_templates()
+    data = copy.deepcopy(_load_mail_templates())
 
     def _slug(name: str) -> str:
         return (name or '').lower().replace(' ', '_')
@@ -1204,20 +2329,16 @@ def save_mail_templates_bulk():
 @app.route('/admin/rejected')
 def view_rejected():
     _require_admin()
-    regs = [
-        r for r in _load_list(REGISTRATIONS_FILE)
-        if r.get('review_status') == 'rejected'
-    ]
-    return render_template('rejected.html', registrations=regs)
+    return _cached_render(lambda: render_template(
+        'rejected.html', registrations=_list_registrations('rejected')
+    ))
 
 
 @app.route('/admin/rejected/delete_all', methods=['POST'])
 def delete_all_rejected():
     """Delete all registrations marked as rejected."""
     _require_admin()
-    regs = _load_list(REGISTRATIONS_FILE)
-    kept = [r for r in regs if r.get('review_status') != 'rejected']
-    _save_list(REGISTRATIONS_FILE, kept)
+    _delete_registrations(status='rejected')
     flash('All rejected registrations deleted.', 'success')
     token = request.args.get('token') or request.form.get('token')
     next_url = request.form.get('next') or request.args.get('next')
@@ -1240,15 +2361,7 @@ def delete_selected_rejected():
         token = request.args.get('token') or request.form.get('token')
         return redirect(url_for('view_rejected', token=token))
 
-    regs = _load_list(REGISTRATIONS_FILE)
-    kept = []
-    removed = 0
-    for r in regs:
-        if r.get('review_status') == 'rejected' and r.get('id') in ids:
-            removed += 1
-            continue
-        kept.append(r)
-    _save_list(REGISTRATIONS_FILE, kept)
+    removed = _delete_registrations(ids, status='rejected')
     flash(f'Deleted {removed} rejected registration(s).', 'success')
     token = request.args.get('token') or request.form.get('token')
     next_url = request.form.get('next') or request.args.get('next')
@@ -1257,6 +2370,19 @@ def delete_selected_rejected():
     return redirect(url_for('view_rejected', token=token))
 
 
+# Default message for send_mail_single, filled in with format_map
+_REJECT_SUBJECT = 'Regarding your application to IgnividhaTech'
+_REJECT_TMPL = (
+    "Hello {fullname},\n\n"
+    "Thank you for your interest in IgnividhaTech. "
+    "After careful review, we won’t be moving forward with your "
+    "application at this time.\n\n"
+    "We appreciate the time you invested and encourage you to "
+    "apply again in the future.\n\n"
+    "Regards,\nIgnividhaTech Team"
+)
+
+
 @app.route('/admin/registrations/send_mail_single', methods=['POST'])
 def send_mail_single():
     """Send an email to a single registration by ID.
@@ -1271,8 +2397,7 @@ def send_mail_single():
     body = (request.form.get('body') or '').strip()
 
     # Find the registration
-    regs = _load_list(REGISTRATIONS_FILE)
-    reg = next((r for r in regs if r.get('id') == reg_id), None)
+    reg = _get_registration(reg_id)
     if not reg:
         flash('Invalid candidate.', 'error')
         token = request.args.get('token') or request.form.get('token')
@@ -1285,19 +2410,10 @@ def send_mail_single():
         return redirect(url_for('view_rejected', token=token))
 
     # Default message if not provided
-    if not subject:
-        subject = 'Regarding your application to IgnividhaTech'
-    if not body:
-        fullname = reg.get('fullname') or 'Candidate'
-        body = (
-            f"Hello {fullname},\n\n"
-            "Thank you for your interest in IgnividhaTech. "
-            "After careful review, we won’t be moving forward with your "
-            "application at this time.\n\n"
-            "We appreciate the time you invested and encourage you to "
-            "apply again in the future.\n\n"
-            "Regards,\nIgnividhaTech Team"
-        )
+    subject = subject or _REJECT_SUBJECT
+    body = body or _REJECT_TMPL.format_map(
+        {'fullname': reg.get('fullname') or 'Candidate'}
+    )
 
     if not _smtp_configured():
         flash(
@@ -1307,11 +2423,8 @@ def send_mail_single():
         token = request.args.get('token') or request.form.get('token')
         return redirect(url_for('view_rejected', token=token))
 
-    sent_count, err = _send_bulk_email(subject, body, [email])
-    if err:
-        flash(f'Failed to send email: {err}', 'error')
-    else:
-        flash(f'Email sent to {email}.', 'success')
+    _enqueue_mail(subject, body, [email])
+    flash(f'Email to {email} queued for delivery.', 'success')
 
     token = request.args.get('token') or request.form.get('token')
     next_url = request.form.get('next') or request.args.get('next')
@@ -1323,19 +2436,15 @@ def send_mail_single():
 @app.route('/admin/paused')
 def view_paused():
     _require_admin()
-    regs = [
-        r for r in _load_list(REGISTRATIONS_FILE)
-        if r.get('review_status') == 'paused'
-    ]
-    return render_template('paused.html', registrations=regs)
+    return _cached_render(lambda: render_template(
+        'paused.html', registrations=_list_registrations('paused')
+    ))
 
 
 @app.route('/admin/registrations/delete/<int:reg_id>', methods=['POST'])
 def delete_registration(reg_id):
     _require_admin()
-    regs = _load_list(REGISTRATIONS_FILE)
-    new_regs = [r for r in regs if r.get('id') != reg_id]
-    _save_list(REGISTRATIONS_FILE, new_regs)
+    _delete_registrations([reg_id])
     flash('Registration deleted successfully!', 'success')
     token = request.args.get('token') or request.form.get('token')
     next_url = request.form.get('next') or request.args.get('next')
@@ -1347,72 +2456,147 @@ def delete_registration(reg_id):
 @app.route('/admin/queries')
 def view_queries():
     _require_admin()
-    qs = _load_list(QUERIES_FILE)
+    qs = _list_queries()
     return render_template('queries.html', queries=qs)
 
 
 @app.route('/uploads/<path:filename>')
 def uploaded_file(filename):
+    path = safe_join(app.config['UPLOAD_FOLDER'], filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+    if UPLOADS_ACCEL_REDIRECT:
+        # nginx streams the file itself; the worker returns immediately
+        resp = Response()
+        resp.headers['X-Accel-Redirect'] = (
+            UPLOADS_ACCEL_REDIRECT.rstrip('/') + '/' + quote(filename)
+        )
+        # Let nginx pick the content type for the file
+        del resp.headers['Content-Type']
+        return resp
     return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
 
 
 # --- EXCEL EXPORTS ---
 def _selected_rows_for_excel(position: str | None = None):
     """Return rows for Excel: [Name, Position, Email, Contact]."""
-    regs = [
-        r for r in _load_list(REGISTRATIONS_FILE)
-        if r.get('review_status') == 'selected'
-    ]
-    if position:
-        regs = [
-            r for r in regs if r.get('selected_position') == position
-        ]
-    rows = []
-    for r in regs:
-        rows.append([
-            r.get('fullname') or '',
-            r.get('selected_position') or '',
-            r.get('email') or '',
-            r.get('contact') or '',
-        ])
-    return rows
-
-
-def _excel_response(rows: list[list[str]], filename: str):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = 'Selected'
-    ws.append(['Student Name', 'Position', 'Email', 'Contact Number'])
+    return _registration_field_rows(
+        ('fullname', 'selected_position', 'email', 'contact'),
+        'selected',
+        position,
+    )
+
+
+XLSX_MIMETYPE = (
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+)
+# Most exports kept in EXPORTS_FOLDER; the least recently downloaded
+# go first. Any ?position= makes its own export, so this bounds the
+# folder however many distinct ones get requested.
+EXPORTS_KEEP = 32
+
+
+def _prune_exports(stem: str, name: str):
+    """Drop stale versions of this export, then the least recently used
+    exports beyond EXPORTS_KEEP (mtime is bumped on every hit, so this
+    LRU order is shared by all worker processes).
+    """
+    entries = []
+    for old in os.listdir(EXPORTS_FOLDER):
+        path = os.path.join(EXPORTS_FOLDER, old)
+        try:
+            if old.startswith(stem + '-') and old != name:
+                os.unlink(path)
+            elif old.endswith('.xlsx'):
+                entries.append((os.stat(path).st_mtime_ns, path))
+        except OSError:
+            pass
+    entries.sort()
+    for _, path in entries[:max(0, len(entries) - EXPORTS_KEEP)]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _build_xlsx(path: str, rows, title: str, header: tuple, widths: tuple):
+    """Write the workbook to a temp file next to path, then move it into
+    place so concurrent downloads never see a half-written file.
+    """
+    # write_only streams rows into the sheet XML instead of building a
+    # styled Cell object for every value
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title)
+    # Optional: widen columns a bit (must precede the first row here)
+    for col, width in zip('ABCDEFGH', widths):
+        ws.column_dimensions[col].width = width
+    ws.append(list(header))
     for row in rows:
         ws.append(row)
-    # Optional: widen columns a bit
-    for col, width in zip(['A', 'B', 'C', 'D'], [22, 18, 28, 18]):
-        ws.column_dimensions[col].width = width
-    buf = BytesIO()
-    wb.save(buf)
-    buf.seek(0)
+    fd, tmp = tempfile.mkstemp(dir=EXPORTS_FOLDER, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            # mkstemp creates 0600; the front web server (X-Sendfile /
+            # X-Accel-Redirect) usually runs as another user
+            os.fchmod(f.fileno(), 0o644)
+            wb.save(f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _excel_response(
+    make_rows,
+    filename: str,
+    key: tuple,
+    title: str = 'Selected',
+    header: tuple = ('Student Name', 'Position', 'Email', 'Contact Number'),
+    widths: tuple = (22, 18, 28, 18),
+):
+    """Send the export identified by key, building it with make_rows()
+    only if registrations changed since it was last written.
+    """
+    stem = hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
+    name = f'{stem}-{_registrations_version()}.xlsx'
+    path = os.path.join(EXPORTS_FOLDER, name)
+    try:
+        # Mark as recently used for _prune_exports
+        os.utime(path)
+    except FileNotFoundError:
+        _build_xlsx(path, make_rows(), title, header, widths)
+        _prune_exports(stem, name)
+    if EXPORTS_ACCEL_REDIRECT:
+        # nginx streams the file itself; the worker returns immediately
+        resp = Response(mimetype=XLSX_MIMETYPE)
+        resp.headers['X-Accel-Redirect'] = (
+            EXPORTS_ACCEL_REDIRECT.rstrip('/') + '/' + name
+        )
+        resp.headers['Content-Disposition'] = (
+            "attachment; filename*=UTF-8''" + quote(filename)
+        )
+        return resp
+    # With USE_X_SENDFILE this only emits the header, too
     return send_file(
-        buf,
+        path,
         as_attachment=True,
         download_name=filename,
-        mimetype=(
-            'application/vnd.openxmlformats-officedocument.'
-            'spreadsheetml.sheet'
-        ),
+        mimetype=XLSX_MIMETYPE,
     )
 
 
 @app.route('/admin/selected/download')
 def download_selected_excel():
     _require_admin()
-    pos = request.args.get('position')
-    rows = _selected_rows_for_excel(pos)
+    pos = request.args.get('position') or None
     if pos:
         safe = pos.replace(' ', '_')
         fname = f'selected_{safe}.xlsx'
     else:
         fname = 'selected_all_positions.xlsx'
-    return _excel_response(rows, fname)
+    return _excel_response(
+        lambda: _selected_rows_for_excel(pos), fname, ('selected', pos)
+    )
 
 
 @app.route('/admin/positions/download')
@@ -1423,44 +2607,25 @@ def download_position_excel():
         flash('Position is required to download.', 'error')
         token = request.args.get('token')
         return redirect(url_for('view_positions', token=token))
-    rows = _selected_rows_for_excel(pos)
     safe = pos.replace(' ', '_')
     fname = f'selected_{safe}.xlsx'
-    return _excel_response(rows, fname)
+    return _excel_response(
+        lambda: _selected_rows_for_excel(pos), fname, ('selected', pos)
+    )
 
 
 @app.route('/admin/rejected/download')
 def download_rejected_excel():
     """Download rejected candidates with only Name and Email in Excel."""
     _require_admin()
-    regs = [
-        r for r in _load_list(REGISTRATIONS_FILE)
-        if r.get('review_status') == 'rejected'
-    ]
     # Build two-column rows: Name, Email
-    wb = Workbook()
-    ws = wb.active
-    ws.title = 'Rejected'
-    ws.append(['Student Name', 'Email'])
-    for r in regs:
-        ws.append([
-            r.get('fullname') or '',
-            r.get('email') or '',
-        ])
-    # Optional: widths
-    ws.column_dimensions['A'].width = 24
-    ws.column_dimensions['B'].width = 30
-    buf = BytesIO()
-    wb.save(buf)
-    buf.seek(0)
-    return send_file(
-        buf,
-        as_attachment=True,
-        download_name='rejected_candidates.xlsx',
-        mimetype=(
-            'application/vnd.openxmlformats-officedocument.'
-            'spreadsheetml.sheet'
-        ),
+    return _excel_response(
+        lambda: _registration_field_rows(('fullname', 'email'), 'rejected'),
+        'rejected_candidates.xlsx',
+        ('rejected',),
+        title='Rejected',
+        header=('Student Name', 'Email'),
+        widths=(24, 30),
     )
 
 